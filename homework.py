@@ -1,14 +1,20 @@
 import os
 import sys
-import json
 import time
+import random
+import signal
 import logging
+import logging.handlers
+import functools
 import requests
 import telegram
+import messages
 import exceptions
 
 
-from typing import Union
+from datetime import datetime
+from types import MappingProxyType
+from typing import Optional
 from dotenv import load_dotenv
 from http import HTTPStatus
 
@@ -19,22 +25,48 @@ load_dotenv()
 PRACTICUM_TOKEN = os.getenv('TOKEN_YP')
 TELEGRAM_TOKEN = os.getenv('TOKEN_BOT')
 TELEGRAM_CHAT_ID = os.getenv('TG_CHAT_ID')
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+ADAPTIVE_POLLING = os.getenv('ADAPTIVE_POLLING', '').lower() in (
+    '1', 'true', 'yes'
+)
 
 RETRY_PERIOD = 600
+BASE_DELAY = 60
+MAX_DELAY = 3600
+JITTER = 0.5
+MAX_SEND_FAILURES = 3
+POLL_SCHEDULE = {
+    (9, 19): 300,
+    (19, 23): 900,
+    (23, 9): 1800,
+}
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+REQUEST_TIMEOUT = (5, 25)
 
 
-HOMEWORK_VERDICTS = {
+HOMEWORK_VERDICTS = MappingProxyType({
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
-}
+})
+_UNKNOWN = object()
+
+_STATUS_MSG_TEMPLATE = 'Изменился статус проверки работы "{name}". {verdict}'
+_ACCESS_ERROR_TEMPLATE = (
+    'При обращении к сервису, произошла ошибка доступа. Код: {code}.'
+)
+
+RECOVERABLE_ERRORS = (exceptions.EndpointError,)
 
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 handler = logging.StreamHandler(sys.stdout)
+stdout_level = logging.getLevelName(LOG_LEVEL)
+handler.setLevel(
+    stdout_level if isinstance(stdout_level, int) else logging.INFO
+)
 formatter = logging.Formatter(
     '%(asctime)s - %(levelname)s - %(funcName)s - %(lineno)d - %(message)s'
 )
@@ -50,15 +82,22 @@ def check_tokens() -> bool:
         True - если все переменные окружения доступны.
         False - если какая-то из переменных окружения недоступна.
     """
-    token_list = [PRACTICUM_TOKEN, TELEGRAM_TOKEN, TELEGRAM_CHAT_ID]
-    for token in token_list:
-        if token is None:
-            logging.critical(exceptions.ENVIRONMENT_VARIABLE_IS_MISSING)
-            return False
+    missing = [
+        name for name, value in (
+            ('TOKEN_YP', PRACTICUM_TOKEN),
+            ('TOKEN_BOT', TELEGRAM_TOKEN),
+            ('TG_CHAT_ID', TELEGRAM_CHAT_ID),
+        ) if value is None
+    ]
+    if missing:
+        logger.critical(
+            '%s %s', messages.ENVIRONMENT_VARIABLE_IS_MISSING, missing
+        )
+        return False
     return True
 
 
-def get_api_answer(timestamp: int) -> Union[dict, Exception]:
+def get_api_answer(timestamp: int) -> dict:
     """
     Функция производит запрос к эндпоинту API-сервиса.
 
@@ -67,33 +106,36 @@ def get_api_answer(timestamp: int) -> Union[dict, Exception]:
     Result:
         dict - JSON-ответ API-сервиса в виде словаря.
     """
-    payload = {'from_date': 1678502400}
     try:
-        response = requests.get(url=ENDPOINT, headers=HEADERS, params=payload)
-        if response.status_code != HTTPStatus.OK:
-            logging.error(
-                f'Ошибка при запросе к эндпоинту API-сервиса. '
-                f'Код статуса: {response.status_code}.'
-            )
-            raise exceptions.EndpointError(response.status_code)
-
-    except json.decoder.JSONDecodeError as error:
-        logging.error(f'Ошибка при декодировании JSON: {error}.')
-        return error
-
-    except requests.exceptions.ConnectionError as error:
-        logging.error(f'Ошибка соединения: {error}.')
-        return error
-
-    except Exception as error:
-        logging.error(f'Ошибка при запросе к основному API: {error}.')
-        raise SystemError(f'Запрошенный эндпоинт не доступен: {error}.')
-
-    else:
+        response = requests.get(
+            url=ENDPOINT,
+            headers=HEADERS,
+            params={'from_date': timestamp},
+            timeout=REQUEST_TIMEOUT,
+        )
+    except requests.exceptions.RequestException as error:
+        logger.error('Ошибка при запросе к основному API: %s.', error)
+        raise exceptions.EndpointError(
+            f'Запрошенный эндпоинт не доступен: {error}.'
+        ) from error
+
+    if response.status_code != HTTPStatus.OK:
+        logger.error(
+            'Ошибка при запросе к эндпоинту API-сервиса. '
+            'Код статуса: %s.', response.status_code
+        )
+        raise exceptions.EndpointError(response.status_code)
+
+    try:
         return response.json()
+    except ValueError as error:
+        logger.error('Ошибка при декодировании JSON: %s.', error)
+        raise exceptions.EndpointError(
+            f'Ошибка при декодировании JSON: {error}.'
+        ) from error
 
 
-def check_response(response: dict) -> dict:
+def check_response(response: dict) -> Optional[dict]:
     """
     Функция проверяет соответствие ответа API ожидаемому значению.
 
@@ -101,35 +143,36 @@ def check_response(response: dict) -> dict:
         response: dict - JSON-ответ API в виде словаря.
     Result:
         dict - информация о первой домашней работе из списка в виде словаря.
+        None - если с момента прошлого запроса статусы не менялись
+        (список "homeworks" пуст).
     """
-    if 'code' in response:
-        logging.error(f'Ошибка доступа к API. Код: {response["code"]}.')
-        raise exceptions.AccessError(
-            f'При обращении к сервису, произошла ошибка доступа. '
-            f'Код: {response["code"]}.'
-        )
-
-    if not isinstance(response, dict):
-        logging.error(
+    try:
+        homeworks = response['homeworks']
+    except TypeError:
+        logger.error(
             'Некорректный формат ответа API. '
             'Объект "response" должен быть словарём.'
         )
         raise TypeError(
             'Некорректный формат ответа API. '
             'Данные приходят не в виде словаря.'
-        )
-
-    if 'homeworks' not in response:
-        logging.error(
+        ) from None
+    except KeyError:
+        if 'code' in response:
+            logger.error('Ошибка доступа к API. Код: %s.', response['code'])
+            raise exceptions.AccessError(
+                _ACCESS_ERROR_TEMPLATE.format(code=response['code'])
+            ) from None
+        logger.error(
             'Некорректный формат ответа API. Отсутствует ключ "homeworks".'
         )
         raise KeyError(
             'Структура данных не соответствует ожиданиям. '
             'Отсутствует ключ "homeworks".'
-        )
+        ) from None
 
-    if not isinstance(response['homeworks'], list):
-        logging.error(
+    if not isinstance(homeworks, list):
+        logger.error(
             'Некорректный формат ответа API. '
             'Ключ "homeworks" должен быть списком.'
         )
@@ -137,12 +180,10 @@ def check_response(response: dict) -> dict:
             'Некорректный формат ответа API. Данные приходят не в виде списка.'
         )
 
-    if response['homeworks']:
-        return response['homeworks'][0]
-
-    else:
-        logging.error(exceptions.HOMEWORS_LIST_IS_EMPTY)
-        raise IndexError(exceptions.HOMEWORS_LIST_IS_EMPTY)
+    if not homeworks:
+        logger.debug(messages.HOMEWORS_LIST_IS_EMPTY)
+        return None
+    return homeworks[0]
 
 
 def parse_status(homework: dict) -> str:
@@ -154,89 +195,226 @@ def parse_status(homework: dict) -> str:
     Result:
         message: str - сообщение с информацией о статусе проверки работы.
     """
-    homework_name = homework.get('homework_name')
-    if homework_name is None:
-        raise KeyError(
-            'Ключ "homework_name" отсутствует в словаре "homework".'
+    try:
+        return build_status_message(
+            homework['homework_name'], homework['status']
         )
+    except KeyError as error:
+        raise KeyError(
+            f'Ключ {error} отсутствует в словаре "homework".'
+        ) from None
+
+
+@functools.lru_cache(maxsize=64)
+def build_status_message(homework_name: str, homework_status: str) -> str:
+    """
+    Функция формирует сообщение о статусе проверки домашней работы.
+
+    Результат кэшируется: для одной и той же пары (название, статус)
+    строка сообщения собирается только один раз.
 
-    homework_status = homework.get('status')
-    if homework_status not in HOMEWORK_VERDICTS:
-        logging.error(exceptions.UNKNOWN_STATUS)
+    Attributes:
+        homework_name: str - название домашней работы.
+        homework_status: str - статус проверки домашней работы.
+    Result:
+        message: str - сообщение с информацией о статусе проверки работы.
+    """
+    verdict = HOMEWORK_VERDICTS.get(homework_status, _UNKNOWN)
+    if verdict is _UNKNOWN:
+        logger.error(messages.UNKNOWN_STATUS)
         raise exceptions.StatusCodeError(
             f'Некорректный статус домашней работы: {homework_status}'
         )
 
-    verdict = HOMEWORK_VERDICTS[homework_status]
-    message = f'Изменился статус проверки работы "{homework_name}". {verdict}'
-    return message
+    return _STATUS_MSG_TEMPLATE.format(name=homework_name, verdict=verdict)
 
 
-def send_message(bot: telegram.Bot, message: str) -> None:
+def send_message(bot: telegram.Bot, message: str) -> bool:
     """
     Функция отправляет сообщение о статусе домашней работы пользователю.
 
     Attributes:
         bot: объект бота из библиотеки python-telegram-bot.
         message: str - сообщение с информацией о статусе проверки работы.
+    Result:
+        True - если сообщение отправлено.
+        False - если при отправке произошла ошибка Telegram.
     """
     try:
         bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=message)
-        logging.debug(f'Сообщение "{message}" отправленно пользователю.')
     except telegram.error.TelegramError as error:
-        logging.error(f'{exceptions.FAILED_SEND_MESSAGE}. Ошибка: {error}')
+        logger.error(
+            '%s Ошибка: %s', messages.FAILED_SEND_MESSAGE, error
+        )
+        return False
+    logger.debug(messages.MESSAGE_SENT_SUCCESSFULLY, message)
+    return True
+
+
+def send_and_log(
+    bot: telegram.Bot, message: str, log_text: bool = True
+) -> bool:
+    """
+    Функция отправляет сообщение пользователю и записывает его в лог.
+
+    Через неё проходят все уведомления бота. Текст попадает в лог только
+    после успешной отправки. Для сообщений о сбоях log_text=False:
+    сама ошибка уже записана в лог там, где она возникла.
+
+    Attributes:
+        bot: объект бота из библиотеки python-telegram-bot.
+        message: str - текст сообщения.
+        log_text: bool - записывать ли текст сообщения в лог.
+    Result:
+        bool - результат отправки, который вернула send_message.
+    """
+    sent = send_message(bot, message)
+    if sent and log_text:
+        logger.info(message)
+    return sent
+
+
+def reset_bot(bot: telegram.Bot) -> telegram.Bot:
+    """
+    Функция пересоздаёт бота после серии неудачных отправок.
+
+    Пул соединений старого бота закрывается, чтобы не оставлять
+    открытыми сокеты, которые могли прийти в негодность.
+
+    Attributes:
+        bot: объект бота, который больше не удаётся использовать.
+    Result:
+        telegram.Bot - новый объект бота.
+    """
+    logger.warning(
+        'Не удалось отправить %s сообщений подряд, бот создаётся заново.',
+        MAX_SEND_FAILURES
+    )
+    bot.request.stop()
+    return telegram.Bot(token=TELEGRAM_TOKEN)
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Функция вычисляет паузу перед повторным запросом после сбоя.
+
+    Attributes:
+        attempt: int - номер неудачной попытки подряд, начиная с нуля.
+    Result:
+        float - пауза в секундах: экспоненциальный рост со случайным
+        разбросом, ограниченный значением MAX_DELAY.
+    """
+    delay = BASE_DELAY * 2 ** attempt * (1 + random.uniform(0, JITTER))
+    return min(MAX_DELAY, delay)
+
+
+def delay_for_hour(hour: int) -> int:
+    """
+    Функция подбирает паузу между опросами API по времени суток.
+
+    Ревью обычно приходят в рабочие часы, поэтому днём API опрашивается
+    чаще, а ночью реже. Расписание включается переменной окружения
+    ADAPTIVE_POLLING, иначе используется постоянный период RETRY_PERIOD.
+
+    Attributes:
+        hour: int - текущий час (0-23) по местному времени сервера.
+    Result:
+        int - пауза в секундах до следующего запроса.
+    """
+    if not ADAPTIVE_POLLING:
+        return RETRY_PERIOD
+    for (start, end), delay in POLL_SCHEDULE.items():
+        if start <= end:
+            in_window = start <= hour < end
+        else:
+            in_window = hour >= start or hour < end
+        if in_window:
+            return delay
+    return RETRY_PERIOD
+
+
+def handle_sigterm(signum: int, frame) -> None:
+    """
+    Функция завершает работу бота по сигналу остановки.
+
+    Исключение SystemExit прерывает текущую паузу time.sleep(),
+    поэтому бот останавливается сразу, не дожидаясь следующего опроса.
+
+    Attributes:
+        signum: int - номер полученного сигнала.
+        frame: текущий кадр стека (не используется).
+    """
+    logger.info('Получен сигнал %s, бот останавливается.', signum)
+    sys.exit()
 
 
 def main():
     """Основная логика работы бота."""
-    bot = telegram.Bot(token=TELEGRAM_TOKEN)
-    timestamp = int(time.time())
-    status_check = ''
-
     if not check_tokens():
-        logging.critical(
-            'Ошибка. Отсутствует одна или несколько переменных окружения.'
-        )
         sys.exit()
 
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+    bot = telegram.Bot(token=TELEGRAM_TOKEN)
+    timestamp = int(time.time())
+    last_key = None
+    attempt = 0
+    send_failures = 0
+
     while True:
+        message = None
+        log_text = False
         try:
             response = get_api_answer(timestamp)
             timestamp = response['current_date']
             homework = check_response(response)
-            message = parse_status(homework)
-            status_check_now = homework['status']
-            if status_check_now != status_check:
-                send_message(bot, message)
-            status_check = status_check_now
-            logging.debug(exceptions.MESSAGE_SENT_SUCCESSFULLY.format(message))
-            logging.info(homework)
-
-        except IndexError:
-            message = 'Статус домашней работы не изменился'
-            send_message(bot, message)
-            logging.debug(exceptions.MESSAGE_SENT_SUCCESSFULLY.format(message))
-            logging.info(message)
+            if homework is not None:
+                key = (homework.get('id'), homework.get('status'))
+                if key != last_key:
+                    message = parse_status(homework)
+                    log_text = True
+                    logger.info('homework=%r', homework)
+                    last_key = key
+            attempt = 0
+            delay = delay_for_hour(datetime.now().hour)
+
+        except RECOVERABLE_ERRORS as error:
+            # О затяжном сбое пользователь узнаёт один раз, а не на
+            # каждой повторной попытке.
+            error_message = f'Сбой в работе программы: {error}'
+            message = error_message if attempt == 0 else None
+            delay = backoff_delay(attempt)
+            attempt += 1
 
         except Exception as error:
             message = f'Сбой в работе программы: {error}'
-            send_message(bot, message)
-            logging.debug(exceptions.MESSAGE_SENT_SUCCESSFULLY.format(message))
+            delay = RETRY_PERIOD
 
-        finally:
-            time.sleep(RETRY_PERIOD)
+        if message is not None:
+            sent = send_and_log(bot, message, log_text=log_text)
+            send_failures = 0 if sent else send_failures + 1
+            if send_failures >= MAX_SEND_FAILURES:
+                bot = reset_bot(bot)
+                send_failures = 0
+
+        time.sleep(delay)
 
 
 if __name__ == '__main__':
 
-    logging.basicConfig(
-        format=(
-            '%(asctime)s-%(levelname)s-%(funcName)s-%(lineno)d-%(message)s'
-        ),
-        filename='main.log',
-        filemode='w',
-        level=logging.DEBUG,
-        encoding='utf-8',
+    file_handler = logging.FileHandler(
+        'main.log', mode='w', encoding='utf-8'
     )
+    file_handler.setFormatter(formatter)
+    logger.addHandler(logging.handlers.MemoryHandler(
+        capacity=100,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    ))
+    if not isinstance(stdout_level, int):
+        logger.warning(
+            'Неизвестный LOG_LEVEL=%s, используется INFO.', LOG_LEVEL
+        )
 
     main()
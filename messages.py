@@ -0,0 +1,11 @@
+"""
+Здесь хранятся тексты сообщений бота.
+The bot message texts are stored here.
+"""
+
+
+ENVIRONMENT_VARIABLE_IS_MISSING = 'Переменная окружения отсутствует.'
+MESSAGE_SENT_SUCCESSFULLY = 'Сообщение "%s" успешно отправлено.'
+HOMEWORS_LIST_IS_EMPTY = 'Новых статусов домашних работ нет.'
+UNKNOWN_STATUS = 'Неизвестный статус домашней работы.'
+FAILED_SEND_MESSAGE = 'Не удалось отправить сообщение пользователю.'
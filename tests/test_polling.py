@@ -0,0 +1,256 @@
+import random
+import time
+from http import HTTPStatus
+
+import pytest
+import requests
+import telegram
+
+import exceptions
+import utils
+
+
+class FailingRequest:
+    def __init__(self):
+        self.is_stopped = False
+
+    def stop(self):
+        self.is_stopped = True
+
+
+class FailingTelegramBot:
+    instances = []
+
+    def __init__(self, token=None, **kwargs):
+        self.request = FailingRequest()
+        FailingTelegramBot.instances.append(self)
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        raise telegram.error.NetworkError('Telegram is down')
+
+
+def mock_response_get_with_data(random_timestamp, data):
+    def mocked_response(*args, **kwargs):
+        response = utils.MockResponseGET(
+            *args, random_timestamp=random_timestamp,
+            http_status=HTTPStatus.OK, **kwargs
+        )
+        response.json = lambda: data
+        return response
+    return mocked_response
+
+
+def break_after_sleeps(monkeypatch, qty):
+    sleeps = []
+
+    def mock_sleep(secs):
+        sleeps.append(secs)
+        if len(sleeps) >= qty:
+            raise utils.BreakInfiniteLoop('break')
+
+    monkeypatch.setattr(time, 'sleep', mock_sleep)
+    return sleeps
+
+
+def raise_on_get(error):
+    def mock_request_get(*args, **kwargs):
+        raise error
+    return mock_request_get
+
+
+class TestPolling:
+
+    @pytest.fixture(autouse=True)
+    def set_tokens(self, monkeypatch, homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+
+    @pytest.mark.parametrize('hour, expected', [
+        (8, 1800), (9, 300), (18, 300), (19, 900),
+        (22, 900), (23, 1800), (0, 1800),
+    ])
+    def test_delay_for_hour_with_schedule(self, monkeypatch, hour, expected,
+                                          homework_module):
+        monkeypatch.setattr(homework_module, 'ADAPTIVE_POLLING', True)
+        assert homework_module.delay_for_hour(hour) == expected, (
+            f'Для часа {hour} ожидается пауза {expected} секунд.'
+        )
+
+    def test_delay_for_hour_without_schedule(self, monkeypatch,
+                                             homework_module):
+        monkeypatch.setattr(homework_module, 'ADAPTIVE_POLLING', False)
+        delays = {homework_module.delay_for_hour(hour) for hour in range(24)}
+        assert delays == {homework_module.RETRY_PERIOD}, (
+            'Без ADAPTIVE_POLLING пауза всегда равна RETRY_PERIOD.'
+        )
+
+    @pytest.mark.parametrize('attempt, jitter, expected', [
+        (0, 0, 60), (0, 0.5, 90), (1, 0, 120), (5, 0.5, 2880),
+        (6, 0, 3600), (10, 0.5, 3600),
+    ])
+    def test_backoff_delay(self, monkeypatch, attempt, jitter, expected,
+                           homework_module):
+        monkeypatch.setattr(random, 'uniform', lambda a, b: jitter)
+        assert homework_module.backoff_delay(attempt) == expected, (
+            f'Для попытки {attempt} ожидается пауза {expected} секунд.'
+        )
+
+    def test_first_retry_is_sooner_than_retry_period(self, monkeypatch,
+                                                     homework_module):
+        monkeypatch.setattr(random, 'uniform', lambda a, b: b)
+        assert (
+            homework_module.backoff_delay(0) < homework_module.RETRY_PERIOD
+        ), (
+            'Первый повторный запрос после сбоя должен отправляться раньше, '
+            'чем через RETRY_PERIOD.'
+        )
+
+    def test_main_sends_unchanged_status_once(self, monkeypatch,
+                                              random_timestamp,
+                                              homework_module):
+        homework = {'id': 1, 'homework_name': 'hw123', 'status': 'approved'}
+        monkeypatch.setattr(requests, 'get', mock_response_get_with_data(
+            random_timestamp,
+            {'homeworks': [homework], 'current_date': random_timestamp}
+        ))
+        sent = []
+        monkeypatch.setattr(
+            homework_module, 'send_message',
+            lambda bot, message: sent.append(message) or True
+        )
+        break_after_sleeps(monkeypatch, 3)
+
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+
+        assert len(sent) == 1, (
+            'Бот должен отправлять сообщение только при изменении статуса.'
+        )
+
+    def test_check_response_with_empty_homeworks(self, random_timestamp,
+                                                 homework_module):
+        response = {'homeworks': [], 'current_date': random_timestamp}
+        assert homework_module.check_response(response) is None, (
+            'Пустой список "homeworks" означает, что новых статусов нет.'
+        )
+
+    def test_main_idle_poll_sends_nothing(self, monkeypatch,
+                                          random_timestamp, homework_module):
+        monkeypatch.setattr(requests, 'get', mock_response_get_with_data(
+            random_timestamp,
+            {'homeworks': [], 'current_date': random_timestamp}
+        ))
+        sent = []
+        monkeypatch.setattr(
+            homework_module, 'send_message',
+            lambda bot, message: sent.append(message) or True
+        )
+        break_after_sleeps(monkeypatch, 3)
+
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+
+        assert not sent, (
+            'Без новых статусов бот не должен отправлять сообщения.'
+        )
+
+    @pytest.mark.parametrize('error', [
+        requests.ConnectionError('connection refused'),
+        requests.Timeout('read timed out'),
+    ])
+    def test_get_api_answer_wraps_request_errors(self, monkeypatch, error,
+                                                 current_timestamp,
+                                                 homework_module):
+        monkeypatch.setattr(requests, 'get', raise_on_get(error))
+        with pytest.raises(exceptions.EndpointError) as excinfo:
+            homework_module.get_api_answer(current_timestamp)
+        assert excinfo.value.__cause__ is error, (
+            'Исходная ошибка запроса должна сохраняться в __cause__.'
+        )
+
+    @pytest.mark.parametrize('error', [
+        RuntimeError('bug in request code'),
+        TypeError('unexpected argument'),
+    ])
+    def test_get_api_answer_propagates_other_errors(self, monkeypatch, error,
+                                                    current_timestamp,
+                                                    homework_module):
+        monkeypatch.setattr(requests, 'get', raise_on_get(error))
+        with pytest.raises(type(error)) as excinfo:
+            homework_module.get_api_answer(current_timestamp)
+        assert excinfo.value is error, (
+            'Ошибки, не связанные с запросом, не должны подменяться.'
+        )
+
+    def test_get_api_answer_with_invalid_json(self, monkeypatch,
+                                              random_timestamp,
+                                              current_timestamp,
+                                              homework_module):
+        def invalid_json():
+            raise ValueError('Expecting value')
+
+        def mock_response_get(*args, **kwargs):
+            response = utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+            response.json = invalid_json
+            return response
+
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        with pytest.raises(exceptions.EndpointError) as excinfo:
+            homework_module.get_api_answer(current_timestamp)
+        assert isinstance(excinfo.value.__cause__, ValueError), (
+            'Ошибка декодирования JSON должна сохраняться в __cause__.'
+        )
+
+    def test_main_backs_off_on_recoverable_error(self, monkeypatch,
+                                                 homework_module):
+        monkeypatch.setattr(requests, 'get', raise_on_get(
+            requests.ConnectionError('connection refused')
+        ))
+        monkeypatch.setattr(
+            homework_module, 'backoff_delay', lambda attempt: attempt + 1
+        )
+        sent = []
+        monkeypatch.setattr(
+            homework_module, 'send_message',
+            lambda bot, message: sent.append(message) or True
+        )
+        sleeps = break_after_sleeps(monkeypatch, 3)
+
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+
+        assert sleeps == [1, 2, 3], (
+            'Паузы после повторяющихся сбоев должны браться из backoff_delay.'
+        )
+        assert len(sent) == 1, (
+            'О затяжном сбое пользователь должен получать одно сообщение.'
+        )
+
+    def test_main_resets_bot_after_send_failures(self, monkeypatch,
+                                                 random_timestamp,
+                                                 homework_module):
+        FailingTelegramBot.instances = []
+        monkeypatch.setattr(telegram, 'Bot', FailingTelegramBot)
+        # Ответ без ключа "homeworks": check_response выбрасывает KeyError,
+        # и на каждой итерации бот пытается отправить сообщение о сбое.
+        monkeypatch.setattr(requests, 'get', mock_response_get_with_data(
+            random_timestamp, {'current_date': random_timestamp}
+        ))
+        break_after_sleeps(
+            monkeypatch, homework_module.MAX_SEND_FAILURES + 1
+        )
+
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+
+        first_bot, *rest = FailingTelegramBot.instances
+        assert first_bot.request.is_stopped, (
+            'Пул соединений старого бота должен закрываться.'
+        )
+        assert len(rest) == 1, (
+            'После серии неудачных отправок бот должен пересоздаваться '
+            'один раз, а счётчик неудач - обнуляться.'
+        )